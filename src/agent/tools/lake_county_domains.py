@@ -0,0 +1,39 @@
+"""
+Normalize user filter values and resolve them to Lake County domain values
+(status, ProjectStatus, jurisdiction).
+Used by list_lake_county_projects and search_lake_county_project_descriptions.
+"""
+from functools import lru_cache
+
+
+def clean_value(value: str | None) -> str | None:
+    """Stripped string value, or None if missing/blank."""
+    if not value:
+        return None
+    return str(value).strip() or None
+
+
+@lru_cache(maxsize=64)
+def _lowered_domain(domain_values: tuple[str, ...]) -> tuple[str, ...]:
+    """Lower-cased copy of a domain, computed once per distinct domain."""
+    return tuple(d.lower() for d in domain_values)
+
+
+@lru_cache(maxsize=1024)
+def resolve_domain_value(user_value: str, domain_values: tuple[str, ...]) -> str | None:
+    """
+    Case-insensitive match; prefer exact, then startswith, then contains.
+    Memoized: pass the tuples from fetch_lake_county_domains as is, so repeated
+    lookups against the cached domains hit.
+    """
+    if not user_value or not domain_values:
+        return None
+    uv = user_value.strip().lower()
+    lowered = _lowered_domain(domain_values)
+    for d, dl in zip(domain_values, lowered):
+        if dl == uv:
+            return d
+    for d, dl in zip(domain_values, lowered):
+        if dl.startswith(uv) or uv in dl:
+            return d
+    return None
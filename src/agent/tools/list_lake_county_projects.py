@@ -10,6 +10,7 @@ from langchain_core.tools.base import InjectedToolCallId
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 
+from src.agent.tools.lake_county_domains import clean_value, resolve_domain_value
 from src.agent.tools.lake_county_project_summary import build_project_summary_and_chart
 from src.api.lake_county_config import (
     PROJECT_CATEGORY_FLOOD_AUDITS,
@@ -18,7 +19,6 @@ from src.api.lake_county_config import (
 )
 from src.api.lake_county_service import (
     fetch_lake_county_domains,
-    fetch_municipality_boundary,
     query_lake_county_projects,
 )
 from src.shared.logging_config import get_logger
@@ -26,20 +26,6 @@ from src.shared.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-def _resolve_value(user_value: str, domain_values: list[str]) -> str | None:
-    """Case-insensitive match; prefer exact, then startswith, then contains."""
-    if not user_value or not domain_values:
-        return None
-    uv = user_value.strip().lower()
-    for d in domain_values:
-        if d.lower() == uv:
-            return d
-    for d in domain_values:
-        if d.lower().startswith(uv) or uv in d.lower():
-            return d
-    return None
-
-
 def _format_attributes(attrs: dict) -> str:
     """Format project attributes for display."""
     lines = []
@@ -89,40 +75,40 @@ async def list_lake_county_projects(
 
     project_types: filter by projecttype (Capital, WMB, SIRF, etc.). subshed: filter by sub-watershed.
     """
-    domains = await fetch_lake_county_domains()
+    status_val = clean_value(status)
+    project_status_val = clean_value(project_status)
+    # Domains are only needed to resolve status terms; skip the lookup otherwise
+    domains = await fetch_lake_county_domains() if status_val or project_status_val else {}
 
     resolved_status = None
-    if status and str(status).strip():
-        resolved = _resolve_value(str(status).strip(), domains.get("status", []))
+    if status_val:
+        resolved = resolve_domain_value(status_val, domains.get("status", ()))
         if resolved:
             resolved_status = resolved
         else:
-            resolved_status = str(status).strip()
+            resolved_status = status_val
 
     resolved_project_status = None
-    if project_status and str(project_status).strip():
-        resolved = _resolve_value(
-            str(project_status).strip(), domains.get("ProjectStatus", [])
+    if project_status_val:
+        resolved = resolve_domain_value(
+            project_status_val, domains.get("ProjectStatus", ())
         )
         if resolved:
             resolved_project_status = resolved
         else:
-            resolved_project_status = str(project_status).strip()
-
-    jurisdiction_val = jurisdiction.strip() if jurisdiction and str(jurisdiction).strip() else None
-    partners_val = project_partners.strip() if project_partners and str(project_partners).strip() else None
-    subshed_val = subshed.strip() if subshed and str(subshed).strip() else None
+            resolved_project_status = project_status_val
 
-    jurisdiction_boundary = None
-    if jurisdiction_val:
-        jurisdiction_boundary = await fetch_municipality_boundary(jurisdiction_val)
+    jurisdiction_val = clean_value(jurisdiction)
+    partners_val = clean_value(project_partners)
+    subshed_val = clean_value(subshed)
 
-    project_types_val = [t.strip() for t in project_types if t and str(t).strip()] if project_types else None
+    project_types_val = [v for v in map(clean_value, project_types) if v] if project_types else None
 
     # Resolve project_category: "projects" | "studies" | "flood_audits"
     category_val = None
-    if project_category and str(project_category).strip():
-        pc = str(project_category).strip().lower()
+    category_input = clean_value(project_category)
+    if category_input:
+        pc = category_input.lower()
         if pc in (PROJECT_CATEGORY_PROJECTS, "project"):
             category_val = PROJECT_CATEGORY_PROJECTS
         elif pc in (PROJECT_CATEGORY_STUDIES, "study"):
@@ -151,6 +137,7 @@ async def list_lake_county_projects(
         subshed=subshed_val,
         project_category=category_val,
         allow_no_filters=not has_filters and not category_val,
+        include_jurisdiction_boundary=True,
     )
 
     if not result["found"]:
@@ -184,6 +171,7 @@ async def list_lake_county_projects(
         "total_returned": len(matches),
         "limit_exceeded": limit_exceeded,
     }
+    jurisdiction_boundary = result.get("jurisdiction_boundary")
     if jurisdiction_boundary and jurisdiction_boundary.get("features"):
         project_result["jurisdiction_boundary"] = jurisdiction_boundary
 
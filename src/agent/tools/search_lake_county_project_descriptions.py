@@ -4,20 +4,19 @@ Filters first (jurisdiction, status, etc.), then ranks by relevance to the query
 """
 from typing import Annotated
 
-from langchain_core.documents import Document
+import numpy as np
 from langchain_core.messages import HumanMessage, ToolMessage
 from langchain_core.tools import tool
 from langchain_core.tools.base import InjectedToolCallId
 from langgraph.prebuilt import InjectedState
-from langchain_core.vectorstores import InMemoryVectorStore
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langgraph.types import Command
 
+from src.agent.tools.lake_county_domains import clean_value, resolve_domain_value
 from src.agent.tools.lake_county_project_summary import build_project_summary_and_chart
 from src.api.lake_county_config import PROJECT_CATEGORY_PROJECTS
 from src.api.lake_county_service import (
     fetch_lake_county_domains,
-    fetch_municipality_boundary,
     query_lake_county_projects,
 )
 from src.shared.config import SharedSettings
@@ -37,35 +36,26 @@ def _last_user_message(messages: list) -> str:
     return ""
 
 
-def _resolve_value(user_value: str, domain_values: list[str]) -> str | None:
-    """Case-insensitive match; prefer exact, then startswith, then contains."""
-    if not user_value or not domain_values:
-        return None
-    uv = user_value.strip().lower()
-    for d in domain_values:
-        if d.lower() == uv:
-            return d
-    for d in domain_values:
-        if d.lower().startswith(uv) or uv in d.lower():
-            return d
-    return None
-
-
 def _project_text_for_embedding(attrs: dict) -> str:
     """Build text from Name, Description, Notes for semantic search."""
-    parts = []
-    name = attrs.get("Name")
-    if name and str(name).strip():
-        parts.append(str(name).strip())
-    desc = attrs.get("Description")
-    if desc and str(desc).strip():
-        parts.append(str(desc).strip())
-    notes = attrs.get("Notes")
-    if notes and str(notes).strip():
-        parts.append(str(notes).strip())
+    parts = [v for v in (clean_value(attrs.get(k)) for k in ("Name", "Description", "Notes")) if v]
     return "\n".join(parts) if parts else "Unnamed project"
 
 
+def _top_k_cosine(vectors: list[list[float]], query_vec: list[float], k: int) -> list[int]:
+    """Indices of the k rows of vectors most cosine-similar to query_vec, best first."""
+    M = np.asarray(vectors, dtype=np.float32)
+    q = np.asarray(query_vec, dtype=np.float32)
+    M /= np.linalg.norm(M, axis=1, keepdims=True) + 1e-12
+    q /= np.linalg.norm(q) + 1e-12
+    scores = M @ q
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top])].tolist()
+
+
 @tool("search_lake_county_project_descriptions")
 async def search_lake_county_project_descriptions(
     semantic_query: str,
@@ -103,29 +93,28 @@ async def search_lake_county_project_descriptions(
             },
         )
 
-    domains = await fetch_lake_county_domains()
+    status_val = clean_value(status)
+    project_status_val = clean_value(project_status)
+    # Domains are only needed to resolve status terms; skip the lookup otherwise
+    domains = await fetch_lake_county_domains() if status_val or project_status_val else {}
 
     resolved_status = None
-    if status and str(status).strip():
-        resolved = _resolve_value(str(status).strip(), domains.get("status", []))
-        resolved_status = resolved if resolved else str(status).strip()
+    if status_val:
+        resolved = resolve_domain_value(status_val, domains.get("status", ()))
+        resolved_status = resolved if resolved else status_val
 
     resolved_project_status = None
-    if project_status and str(project_status).strip():
-        resolved = _resolve_value(
-            str(project_status).strip(), domains.get("ProjectStatus", [])
+    if project_status_val:
+        resolved = resolve_domain_value(
+            project_status_val, domains.get("ProjectStatus", ())
         )
-        resolved_project_status = resolved if resolved else str(project_status).strip()
+        resolved_project_status = resolved if resolved else project_status_val
 
-    jurisdiction_val = jurisdiction.strip() if jurisdiction and str(jurisdiction).strip() else None
-    partners_val = project_partners.strip() if project_partners and str(project_partners).strip() else None
-    subshed_val = subshed.strip() if subshed and str(subshed).strip() else None
+    jurisdiction_val = clean_value(jurisdiction)
+    partners_val = clean_value(project_partners)
+    subshed_val = clean_value(subshed)
 
-    jurisdiction_boundary = None
-    if jurisdiction_val:
-        jurisdiction_boundary = await fetch_municipality_boundary(jurisdiction_val)
-
-    project_types_val = [t.strip() for t in project_types if t and str(t).strip()] if project_types else None
+    project_types_val = [v for v in map(clean_value, project_types) if v] if project_types else None
 
     # Default to normal projects (exclude Flood Audit and Study) for semantic search
     result = await query_lake_county_projects(
@@ -137,6 +126,7 @@ async def search_lake_county_project_descriptions(
         subshed=subshed_val,
         project_category=PROJECT_CATEGORY_PROJECTS,
         allow_no_filters=True,
+        include_jurisdiction_boundary=True,
     )
 
     if not result["found"]:
@@ -155,13 +145,9 @@ async def search_lake_county_project_descriptions(
     matches = result["matches"]
     limit_exceeded = result.get("limit_exceeded", False)
 
-    docs = []
-    for i, m in enumerate(matches):
-        attrs = m.get("attributes", {})
-        text = _project_text_for_embedding(attrs)
-        docs.append(Document(page_content=text, metadata={"idx": i}))
+    texts = [_project_text_for_embedding(m.get("attributes", {})) for m in matches]
 
-    if not docs:
+    if not texts:
         return Command(
             update={
                 "project_result": None,
@@ -178,19 +164,13 @@ async def search_lake_county_project_descriptions(
         model=SharedSettings.dataset_embeddings_model,
         task_type=SharedSettings.dataset_embeddings_task_type,
     )
-    store = InMemoryVectorStore(embeddings)
-    store.add_documents(docs)
-
-    similar = store.similarity_search_with_score(
-        semantic_query,
-        k=min(TOP_K_SEMANTIC, len(matches)),
-    )
+    vectors = await embeddings.aembed_documents(texts)
+    query_vec = await embeddings.aembed_query(semantic_query)
 
-    ranked_matches = []
-    for doc, score in similar:
-        idx = doc.metadata.get("idx")
-        if idx is not None and 0 <= idx < len(matches):
-            ranked_matches.append(matches[idx])
+    ranked_matches = [
+        matches[idx]
+        for idx in _top_k_cosine(vectors, query_vec, min(TOP_K_SEMANTIC, len(matches)))
+    ]
 
     user_query = _last_user_message((state or {}).get("messages", []))
     tool_message, charts_data = await build_project_summary_and_chart(
@@ -206,6 +186,7 @@ async def search_lake_county_project_descriptions(
         "total_returned": len(ranked_matches),
         "limit_exceeded": limit_exceeded,
     }
+    jurisdiction_boundary = result.get("jurisdiction_boundary")
     if jurisdiction_boundary and jurisdiction_boundary.get("features"):
         project_result["jurisdiction_boundary"] = jurisdiction_boundary
 
@@ -78,6 +78,7 @@ from src.api.lake_county_config import (
     LAKE_COUNTY_LAYERS,
     LAKE_COUNTY_LAYERS_BY_ID,
 )
+from src.api.lake_county_service import close_client as close_lake_county_client
 from src.api.lake_county_service import (
     fetch_lake_county_boundary,
     fetch_lake_county_domains,
@@ -126,6 +127,9 @@ async def lifespan(app: FastAPI):
     # Close checkpointer pool
     await close_checkpointer_pool()
 
+    # Close shared Lake County ArcGIS HTTP client
+    await close_lake_county_client()
+
 
 app = FastAPI(
     lifespan=lifespan,
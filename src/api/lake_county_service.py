@@ -3,9 +3,20 @@ Lake County ArcGIS project search.
 """
 import asyncio
 import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from src.api.lake_county_config import (
     CIRS_POINT_URL,
@@ -25,65 +36,451 @@ from src.shared.logging_config import get_logger
 logger = get_logger(__name__)
 MAX_MATCHES = 10
 MAX_LIST_PROJECTS = 50
+# Max IDs per `IN (...)` geometry query (keeps WHERE under ArcGIS request limits)
+GEOMETRY_BATCH_SIZE = 500
+
+# Attributes read downstream from project list queries (filters, summaries, semantic search,
+# map styling). Name search keeps "*" because its detail view renders every attribute.
+PROJECT_OUT_FIELDS = (
+    "project_id,Name,Description,Notes,Geometry,status,ProjectStatus,jurisdiction,"
+    "ProjectPartners,Subshed,projecttype,projectsubtype,is_study"
+)
 
 # Fields we fetch unique values for (for filter resolution)
 DOMAIN_FIELDS = ["status", "ProjectStatus", "jurisdiction"]
 
-_domains_cache: dict[str, list[str]] | None = None
+_client: httpx.AsyncClient | None = None
+
+# ArcGIS answers 429/5xx under load; these are retried with jittered backoff
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Max ArcGIS requests in flight across all callers, to stay under server throttling
+LC_MAX_CONCURRENT_REQUESTS = 8
+_arcgis_sem = asyncio.Semaphore(LC_MAX_CONCURRENT_REQUESTS)
+# Max ArcGIS request starts per second (token bucket, bursts up to the same amount)
+LC_MAX_REQUESTS_PER_SECOND = 10.0
+
+
+class _TokenBucket:
+    """Async token bucket shared by all ArcGIS calls; smooths bursts into a steady rate."""
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+_arcgis_rate = _TokenBucket(LC_MAX_REQUESTS_PER_SECOND)
+
+
+def _arcgis_timeout(read: float) -> httpx.Timeout:
+    """Tight connect/write/pool timeouts; read timeout sized per query."""
+    return httpx.Timeout(connect=5.0, read=read, write=5.0, pool=2.0)
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Shared AsyncClient for all ArcGIS calls.
+    Keeps connections alive across requests (no TCP+TLS handshake per query) and
+    multiplexes concurrent subqueries over HTTP/2. Failed connects are retried by the
+    transport; per-call read timeouts are set in _arcgis_query.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30,
+            ),
+        )
+        _client = httpx.AsyncClient(
+            transport=transport,
+            timeout=_arcgis_timeout(20.0),
+            # GeoJSON compresses ~10:1; httpx decodes br via the brotli package
+            headers={"Accept-Encoding": "br, gzip"},
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared ArcGIS client (called on API shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+_domains_cache: dict[str, tuple[str, ...]] | None = None
 _domains_cache_ts: float = 0.0
 _DOMAINS_CACHE_TTL = 600  # 10 minutes
 
+# County / municipality outlines change on the order of months
+# Entries are (fetched_at, data, conditional-GET headers from the response's ETag/Last-Modified)
+_boundary_cache: dict[str, tuple[float, dict, dict[str, str]]] = {}
+_BOUNDARY_CACHE_TTL = 86400  # 24 hours
+_BOUNDARY_CACHE_MAX = 64
+# Normalized user input -> boundary cache key built from the returned NAMEs, so partial
+# names ("wad", "wadsworth") share one cached outline. Bounded separately (keys are tiny).
+_municipality_aliases: dict[str, str] = {}
+_MUNICIPALITY_ALIASES_MAX = 512
+
+# One lock per cache key so concurrent misses share a single ArcGIS fetch. Locks are
+# reference-counted and dropped when their last user leaves, so user-supplied keys
+# (municipality names) don't accumulate.
+_cache_locks: dict[str, asyncio.Lock] = {}
+_cache_lock_users: dict[str, int] = {}
+
+
+@asynccontextmanager
+async def _cache_lock(key: str) -> AsyncIterator[None]:
+    """Hold the single-flight lock for a cache key."""
+    lock = _cache_locks.get(key)
+    if lock is None:
+        lock = _cache_locks[key] = asyncio.Lock()
+    _cache_lock_users[key] = _cache_lock_users.get(key, 0) + 1
+    try:
+        async with lock:
+            yield
+    finally:
+        _cache_lock_users[key] -= 1
+        if not _cache_lock_users[key]:
+            del _cache_lock_users[key]
+            del _cache_locks[key]
+
+
+# Longer WHERE clauses go out as POST: large IN (...) lists otherwise exceed ArcGIS URL limits (404/414)
+_MAX_GET_WHERE_LEN = 1500
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in _RETRY_STATUSES
+
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.5, max=4.0),
+    reraise=True,
+)
+async def _arcgis_query(
+    client: httpx.AsyncClient,
+    query_url: str,
+    params: dict[str, Any],
+    *,
+    timeout: float,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    """
+    Issue an ArcGIS /query request. Short queries use GET (cacheable by CDNs);
+    queries whose WHERE exceeds _MAX_GET_WHERE_LEN are sent as form-encoded POST.
+    `timeout` is the read timeout. 429/502/503/504 responses are retried up to 3 attempts.
+    At most LC_MAX_CONCURRENT_REQUESTS requests are in flight at once (retry backoff
+    happens outside the slot), started at no more than LC_MAX_REQUESTS_PER_SECOND.
+    """
+    async with _arcgis_sem:
+        await _arcgis_rate.acquire()
+        if len(str(params.get("where", ""))) > _MAX_GET_WHERE_LEN:
+            resp = await client.post(query_url, data=params, headers=headers, timeout=_arcgis_timeout(timeout))
+        else:
+            resp = await client.get(query_url, params=params, headers=headers, timeout=_arcgis_timeout(timeout))
+    if resp.status_code in _RETRY_STATUSES:
+        resp.raise_for_status()
+    # Payload size per query, to verify outFields trimming
+    logger.debug("LC_ARCGIS_RESPONSE_BYTES", url=query_url, status=resp.status_code, bytes=len(resp.content))
+    return resp
+
+
+# Payloads above this are parsed in a worker thread so large GeoJSON doesn't stall the event loop
+_DECODE_OFFLOAD_BYTES = 64_000
+
+
+async def _decode(resp: httpx.Response) -> Any:
+    """Parse a JSON response body with orjson, off-loop when it is large."""
+    content = resp.content
+    if len(content) > _DECODE_OFFLOAD_BYTES:
+        return await asyncio.to_thread(orjson.loads, content)
+    return orjson.loads(content)
+
+
+# Defaults shared by every GeoJSON /query request; override per call via {**_COMMON_PARAMS, ...}
+_COMMON_PARAMS = {"outFields": "*", "returnGeometry": "true", "outSR": 4326, "f": "geojson"}
+# Project list queries: common defaults narrowed to the attributes read downstream
+_PROJECT_PARAMS = {**_COMMON_PARAMS, "outFields": PROJECT_OUT_FIELDS}
+# Internal IN (...) geometry batches: Esri JSON is lighter than server-side GeoJSON and is
+# converted locally (_esri_feature); only the id attribute is requested per call
+_GEOMETRY_BATCH_PARAMS = {"returnGeometry": "true", "outSR": 4326, "f": "json", "resultRecordCount": 2000}
+# Attribute-only distinct-value queries (domain lookups)
+_DISTINCT_PARAMS = {
+    "where": "1=1",
+    "returnGeometry": "false",
+    "returnDistinctValues": "true",
+    "returnExceededLimitFeatures": "true",
+    "f": "json",
+}
+
+
+def _fc(features: list[dict]) -> dict:
+    """
+    Wrap features in a GeoJSON FeatureCollection without copying them.
+    Match dicts share these feature objects (and `geojson` aliases one of the
+    collections), so callers must treat them as read-only.
+    """
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _ring_is_clockwise(ring: list[list[float]]) -> bool:
+    """Shoelace orientation test; Esri outer rings are clockwise, holes counter-clockwise."""
+    total = 0.0
+    for a, b in zip(ring, ring[1:]):
+        total += (b[0] - a[0]) * (b[1] + a[1])
+    return total > 0
+
+
+def _point_in_ring(point: list[float], ring: list[list[float]]) -> bool:
+    """Ray-casting point-in-polygon test against a single ring."""
+    x, y = point[0], point[1]
+    inside = False
+    for a, b in zip(ring, ring[1:]):
+        if (a[1] > y) != (b[1] > y) and x < (b[0] - a[0]) * (y - a[1]) / (b[1] - a[1]) + a[0]:
+            inside = not inside
+    return inside
 
-async def fetch_lake_county_domains() -> dict[str, list[str]]:
+
+def _esri_rings_to_geojson(rings: list[list[list[float]]]) -> dict | None:
+    """
+    Esri polygon rings -> GeoJSON Polygon/MultiPolygon. Each hole is attached to the
+    outer ring containing it; rings are reversed to GeoJSON's counter-clockwise exteriors.
+    """
+    outers: list[list[list[float]]] = []
+    holes: list[list[list[float]]] = []
+    for ring in rings:
+        if len(ring) >= 4:
+            (outers if _ring_is_clockwise(ring) else holes).append(ring)
+    if not outers:
+        # Orientation not honoured by the source: every ring is an outer ring, and being
+        # counter-clockwise already, it is kept as is
+        return _polygon_geometry([[ring] for ring in holes])
+    polygons = [[outer[::-1]] for outer in outers]
+    for hole in holes:
+        for polygon, outer in zip(polygons, outers):
+            if _point_in_ring(hole[0], outer):
+                polygon.append(hole[::-1])
+                break
+        else:
+            # Hole outside every outer ring: an exterior that is already counter-clockwise
+            polygons.append([hole])
+    return _polygon_geometry(polygons)
+
+
+def _polygon_geometry(polygons: list[list[list[list[float]]]]) -> dict | None:
+    """GeoJSON Polygon for one polygon, MultiPolygon for several, None for none."""
+    if not polygons:
+        return None
+    if len(polygons) == 1:
+        return {"type": "Polygon", "coordinates": polygons[0]}
+    return {"type": "MultiPolygon", "coordinates": polygons}
+
+
+def _esri_to_geojson_geom(esri: dict | None) -> dict | None:
+    """Convert an Esri JSON geometry (rings / paths / points / x,y) to a GeoJSON geometry."""
+    if not esri:
+        return None
+    if "rings" in esri:
+        return _esri_rings_to_geojson(esri["rings"])
+    if "paths" in esri:
+        paths = esri["paths"]
+        if len(paths) == 1:
+            return {"type": "LineString", "coordinates": paths[0]}
+        return {"type": "MultiLineString", "coordinates": paths} if paths else None
+    if "points" in esri:
+        return {"type": "MultiPoint", "coordinates": esri["points"]} if esri["points"] else None
+    if esri.get("x") is not None and esri.get("y") is not None:
+        return {"type": "Point", "coordinates": [esri["x"], esri["y"]]}
+    return None
+
+
+def _esri_feature(feat: dict) -> dict:
+    """Esri JSON feature -> GeoJSON Feature (attributes become properties)."""
+    return {
+        "type": "Feature",
+        "geometry": _esri_to_geojson_geom(feat.get("geometry")),
+        "properties": feat.get("attributes", {}),
+    }
+
+
+def _make_room(cache: dict, ttl: float, max_entries: int) -> None:
+    """
+    Ensure a (fetched_at, ...)-valued cache has space for one more entry: once it is
+    full, drop expired entries, then the oldest one.
+    """
+    if len(cache) < max_entries:
+        return
+    now = time.monotonic()
+    for k in [k for k, hit in cache.items() if now - hit[0] >= ttl]:
+        del cache[k]
+    if len(cache) >= max_entries:
+        del cache[next(iter(cache))]
+
+
+def _boundary_cache_get(key: str) -> dict | None:
+    """Return a cached boundary if it is younger than _BOUNDARY_CACHE_TTL."""
+    hit = _boundary_cache.get(key)
+    if hit is not None and (time.monotonic() - hit[0]) < _BOUNDARY_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _boundary_cache_put(key: str, data: dict, resp: httpx.Response) -> None:
+    """Cache a boundary along with the validators needed to revalidate it later."""
+    validators: dict[str, str] = {}
+    if etag := resp.headers.get("ETag"):
+        validators["If-None-Match"] = etag
+    if last_modified := resp.headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = last_modified
+    _boundary_cache.pop(key, None)
+    _make_room(_boundary_cache, _BOUNDARY_CACHE_TTL, _BOUNDARY_CACHE_MAX)
+    _boundary_cache[key] = (time.monotonic(), data, validators)
+
+
+def _municipality_cache_key(data: dict) -> str | None:
+    """Boundary cache key from the NAME(s) of the matched municipalities."""
+    names = sorted({
+        str(f.get("properties", {}).get("NAME") or "").strip().lower()
+        for f in data.get("features", [])
+    } - {""})
+    return f"municipality:{'|'.join(names)}" if names else None
+
+
+def _municipality_alias_put(alias: str, key: str) -> None:
+    """Remember which cached outline a normalized input resolves to (oldest dropped when full)."""
+    _municipality_aliases.pop(alias, None)
+    if len(_municipality_aliases) >= _MUNICIPALITY_ALIASES_MAX:
+        del _municipality_aliases[next(iter(_municipality_aliases))]
+    _municipality_aliases[alias] = key
+
+
+def _boundary_revalidation_headers(key: str) -> dict[str, str]:
+    """Conditional-GET headers for a stale cache entry (empty if none cached)."""
+    hit = _boundary_cache.get(key)
+    return hit[2] if hit is not None else {}
+
+
+def _boundary_not_modified(key: str, resp: httpx.Response) -> dict | None:
+    """On 304 Not Modified, renew the stale entry's TTL and return its data."""
+    hit = _boundary_cache.get(key)
+    if resp.status_code != 304 or hit is None:
+        return None
+    _boundary_cache[key] = (time.monotonic(), hit[1], hit[2])
+    return hit[1]
+
+
+async def fetch_lake_county_domains() -> dict[str, tuple[str, ...]]:
     """
     Fetch unique values for status, ProjectStatus, jurisdiction from Representative Points layer.
     Used so the AI can map user terms (e.g. "submitted", "Under Review") to actual field values.
-    Cached for 10 minutes to avoid repeated ArcGIS calls.
+    Tries one distinct query over all fields first; falls back to one query per field.
+    Cached for 10 minutes to avoid repeated ArcGIS calls; values are tuples so callers can
+    pass the same hashable object to memoized resolvers.
     """
     global _domains_cache, _domains_cache_ts
     if _domains_cache is not None and (time.monotonic() - _domains_cache_ts) < _DOMAINS_CACHE_TTL:
         return _domains_cache
-
+    async with _cache_lock("domains"):
+        if _domains_cache is not None and (time.monotonic() - _domains_cache_ts) < _DOMAINS_CACHE_TTL:
+            return _domains_cache
+        result = await _load_domains()
+        # A failed field comes back empty; don't pin a partial load for the whole TTL
+        if result and all(result.values()):
+            _domains_cache = result
+            _domains_cache_ts = time.monotonic()
+        return result
+
+
+async def _load_domains() -> dict[str, tuple[str, ...]]:
+    """Query ArcGIS for the DOMAIN_FIELDS value lists (uncached)."""
     layer = LAKE_COUNTY_LAYERS_BY_ID.get(LAKE_COUNTY_SEARCH_LAYER_ID)
     if not layer:
         return {}
     query_url = f"{layer['arcgis_url']}/query"
-    result: dict[str, list[str]] = {}
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        async def _fetch_domain(field: str) -> tuple[str, list[str]]:
-            params = {
-                "where": "1=1",
-                "outFields": field,
-                "returnGeometry": "false",
-                "returnDistinctValues": "true",
-                "returnExceededLimitFeatures": "true",
-                "f": "json",
-            }
-            try:
-                resp = await client.get(query_url, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-            except Exception as e:
-                logger.warning("LC_DOMAINS_FETCH_FAILED", field=field, error=str(e))
-                return (field, [])
-            if "error" in data:
-                return (field, [])
-            features = data.get("features", [])
-            values = []
-            for f in features:
-                attr = f.get("attributes", {})
-                v = attr.get(field)
-                if v is not None and str(v).strip():
-                    values.append(str(v).strip())
-            return (field, sorted(set(values)))
-
-        domain_results = await asyncio.gather(*[_fetch_domain(f) for f in DOMAIN_FIELDS])
-        for field, values in domain_results:
-            result[field] = values
-
-    _domains_cache = result
-    _domains_cache_ts = time.monotonic()
+    result: dict[str, tuple[str, ...]] = {}
+
+    client = get_client()
+
+    async def _fetch_domain(field: str) -> tuple[str, tuple[str, ...]]:
+        params = {**_DISTINCT_PARAMS, "outFields": field}
+        try:
+            resp = await _arcgis_query(client, query_url, params, timeout=30.0)
+            resp.raise_for_status()
+            data = await _decode(resp)
+        except Exception as e:
+            logger.warning("LC_DOMAINS_FETCH_FAILED", field=field, error=str(e))
+            return (field, ())
+        if "error" in data:
+            return (field, ())
+        seen: set[str] = set()
+        for f in data.get("features", []):
+            v = f.get("attributes", {}).get(field)
+            if v is None:
+                continue
+            sv = str(v).strip()
+            if sv:
+                seen.add(sv)
+        return (field, tuple(sorted(seen)))
+
+    async def _fetch_combined() -> dict[str, tuple[str, ...]] | None:
+        """Distinct (status, ProjectStatus, jurisdiction) tuples in one request, split per field."""
+        params = {**_DISTINCT_PARAMS, "outFields": ",".join(DOMAIN_FIELDS)}
+        try:
+            resp = await _arcgis_query(client, query_url, params, timeout=30.0)
+            resp.raise_for_status()
+            data = await _decode(resp)
+        except Exception as e:
+            logger.warning("LC_DOMAINS_COMBINED_FAILED", error=str(e))
+            return None
+        # A truncated combination list could silently drop values; use per-field queries instead
+        if "error" in data or data.get("exceededTransferLimit"):
+            logger.info("LC_DOMAINS_COMBINED_FALLBACK", error=data.get("error"))
+            return None
+        seen: dict[str, set[str]] = {field: set() for field in DOMAIN_FIELDS}
+        for f in data.get("features", []):
+            attrs = f.get("attributes", {})
+            for field in DOMAIN_FIELDS:
+                v = attrs.get(field)
+                if v is None:
+                    continue
+                sv = str(v).strip()
+                if sv:
+                    seen[field].add(sv)
+        return {field: tuple(sorted(values)) for field, values in seen.items()}
+
+    combined = await _fetch_combined()
+    if combined is not None:
+        result = combined
+    else:
+        domain_results = await asyncio.gather(
+            *[_fetch_domain(f) for f in DOMAIN_FIELDS],
+            return_exceptions=True,
+        )
+        for field, res in zip(DOMAIN_FIELDS, domain_results):
+            if isinstance(res, BaseException):
+                logger.warning("LC_DOMAINS_FETCH_FAILED", field=field, error=str(res))
+                result[field] = ()
+            else:
+                result[field] = res[1]
     return result
 
 
@@ -92,26 +489,129 @@ MAX_PROJECTS_SEMANTIC_SEARCH = 200
 MAX_PROJECTS_BY_CATEGORY = 1000
 
 
-def _project_category_where(category: str | None) -> str | None:
+# Single-pass escape tables (str.translate): string literals double quotes; LIKE patterns
+# additionally make the wildcards % and _ (and the escape char itself) match literally
+_SQL_QUOTE = str.maketrans({"'": "''"})
+_SQL_LIKE = str.maketrans({"\\": "\\\\", "'": "''", "%": "\\%", "_": "\\_"})
+
+
+def _sql_quote(value: str) -> str:
+    """Escape an already-stripped value for use inside a single-quoted SQL literal."""
+    return value.translate(_SQL_QUOTE)
+
+
+def _sql_like(value: str) -> str:
+    """Escape an already-stripped value for a LIKE pattern used with ESCAPE '\\'."""
+    return value.translate(_SQL_LIKE)
+
+
+def _like_contains(field: str, value: str) -> str:
+    """Case-insensitive CONTAINS clause on field for a stripped, non-blank value."""
+    return f"UPPER({field}) LIKE UPPER('%{_sql_like(value)}%') ESCAPE '\\'"
+
+
+def _like_clauses(fields: dict[str, str | None]) -> list[str]:
+    """Case-insensitive CONTAINS clause per non-blank filter value ({field: value})."""
+    clauses = []
+    for field, value in fields.items():
+        v = str(value).strip() if value else ""
+        if v:
+            clauses.append(_like_contains(field, v))
+    return clauses
+
+
+def _eq_clauses(fields: dict[str, str | None]) -> list[str]:
+    """Case-insensitive equality clause per non-blank filter value ({field: value})."""
+    clauses = []
+    for field, value in fields.items():
+        v = str(value).strip() if value else ""
+        if v:
+            clauses.append(f"UPPER({field}) = UPPER('{_sql_quote(v)}')")
+    return clauses
+
+
+@lru_cache(maxsize=256)
+def _build_project_where(
+    status: str | None,
+    project_status: str | None,
+    project_types: tuple[str, ...],
+    jurisdiction: str | None,
+    project_partners: str | None,
+    subshed: str | None,
+    project_category: str | None,
+) -> tuple[str | None, str | None]:
     """
-    Build WHERE clause for INFLOW project category (Projects, Studies, Flood Audits).
-    INFLOW uses ONLY projectsubtype: Study, Flood Audit, and everything else = Projects.
+    WHERE clause for a project list query (None when no filter applies) and the
+    category clause it includes. Memoized: agents repeat the same filter sets.
     """
-    if not category:
-        return None
-    c = str(category).strip().lower()
-    if c == PROJECT_CATEGORY_PROJECTS:
-        return (
-            "(projectsubtype IS NULL OR projectsubtype <> 'Flood Audit') "
-            "AND (is_study IS NULL OR is_study = 0)"
-        )
-    if c == PROJECT_CATEGORY_STUDIES:
-        return "is_study = 1"
-    if c == PROJECT_CATEGORY_FLOOD_AUDITS:
-        return "projectsubtype = 'Flood Audit'"
+    conditions = []
+
+    cat_where = _project_category_where(project_category)
+    if cat_where:
+        conditions.append(f"({cat_where})")
+
+    stripped_types = (str(t).strip() if t else "" for t in project_types)
+    safe_types = [_sql_quote(t) for t in stripped_types if t]
+    if safe_types:
+        in_clause = ",".join(f"'{t}'" for t in safe_types)
+        conditions.append(f"projecttype IN ({in_clause})")
+    conditions += _eq_clauses({"status": status, "ProjectStatus": project_status})
+    conditions += _like_clauses({
+        "jurisdiction": jurisdiction,
+        "ProjectPartners": project_partners,
+        "Subshed": subshed,
+    })
+    return (" AND ".join(conditions) if conditions else None), cat_where
+
+
+# Short-lived cache of project list results, keyed on (query_url, where, effective_limit).
+# Results are shared across users, so the result, matches list, match dicts and attributes
+# are copied on put and on every hit; the GeoJSON inside matches stays shared and read-only.
+_projects_cache: dict[tuple[str, str, int], tuple[float, dict]] = {}
+_PROJECTS_CACHE_TTL = 60  # seconds
+_PROJECTS_CACHE_MAX = 128
+
+
+def _copy_projects_result(result: dict) -> dict:
+    """Copy of a project list result down to each match and its attributes."""
+    return {
+        **result,
+        "matches": [{**m, "attributes": dict(m["attributes"])} for m in result["matches"]],
+    }
+
+
+def _projects_cache_get(key: tuple[str, str, int]) -> dict | None:
+    """Return a cached project list result if it is younger than _PROJECTS_CACHE_TTL."""
+    hit = _projects_cache.get(key)
+    if hit is not None and (time.monotonic() - hit[0]) < _PROJECTS_CACHE_TTL:
+        return _copy_projects_result(hit[1])
     return None
 
 
+def _projects_cache_put(key: tuple[str, str, int], result: dict) -> None:
+    """Store a result, dropping expired entries (then the oldest) once the cache is full."""
+    _projects_cache.pop(key, None)
+    _make_room(_projects_cache, _PROJECTS_CACHE_TTL, _PROJECTS_CACHE_MAX)
+    _projects_cache[key] = (time.monotonic(), _copy_projects_result(result))
+
+
+# WHERE clause per INFLOW project category (Projects, Studies, Flood Audits).
+# INFLOW uses ONLY projectsubtype: Study, Flood Audit, and everything else = Projects.
+_CATEGORY_WHERE = {
+    PROJECT_CATEGORY_PROJECTS: (
+        "(projectsubtype IS NULL OR projectsubtype <> 'Flood Audit') "
+        "AND (is_study IS NULL OR is_study = 0)"
+    ),
+    PROJECT_CATEGORY_STUDIES: "is_study = 1",
+    PROJECT_CATEGORY_FLOOD_AUDITS: "projectsubtype = 'Flood Audit'",
+}
+
+
+def _project_category_where(category: str | None) -> str | None:
+    """WHERE clause for an INFLOW project category, or None if unknown/empty."""
+    return _CATEGORY_WHERE.get(str(category).strip().lower()) if category else None
+
+
 async def query_lake_county_projects(
     *,
     status: str | None = None,
@@ -123,6 +623,7 @@ async def query_lake_county_projects(
     project_category: str | None = None,
     limit: int = MAX_LIST_PROJECTS,
     allow_no_filters: bool = False,
+    include_jurisdiction_boundary: bool = False,
 ) -> dict[str, Any]:
     """
     Query Lake County projects by filters. Returns matches with PIN + geometry.
@@ -130,65 +631,85 @@ async def query_lake_county_projects(
     project_types: filter by projecttype IN (...)
     project_category: INFLOW tab - "projects" (exclude Flood Audit + Study), "studies", "flood_audits".
     allow_no_filters: if True, fetch up to MAX_PROJECTS_SEMANTIC_SEARCH when no filters (for semantic search).
+    include_jurisdiction_boundary: if True and jurisdiction is set, also fetch the municipality outline
+    concurrently with the project query and return it as "jurisdiction_boundary" (None if not found).
     """
+    query = _query_projects(
+        status=status,
+        project_status=project_status,
+        project_types=project_types,
+        jurisdiction=jurisdiction,
+        project_partners=project_partners,
+        subshed=subshed,
+        project_category=project_category,
+        limit=limit,
+        allow_no_filters=allow_no_filters,
+    )
+    if not (include_jurisdiction_boundary and jurisdiction and str(jurisdiction).strip()):
+        return await query
+
+    async with asyncio.TaskGroup() as tg:
+        projects_task = tg.create_task(query)
+        boundary_task = tg.create_task(fetch_municipality_boundary(jurisdiction))
+    return {**projects_task.result(), "jurisdiction_boundary": boundary_task.result()}
+
+
+async def _query_projects(
+    *,
+    status: str | None,
+    project_status: str | None,
+    project_types: list[str] | None,
+    jurisdiction: str | None,
+    project_partners: str | None,
+    subshed: str | None,
+    project_category: str | None,
+    limit: int,
+    allow_no_filters: bool,
+) -> dict[str, Any]:
+    """Project query behind query_lake_county_projects (see its docstring for the filters)."""
     layer = LAKE_COUNTY_LAYERS_BY_ID.get(LAKE_COUNTY_SEARCH_LAYER_ID)
     if not layer:
         return {"found": False, "matches": [], "limit_exceeded": False}
 
-    conditions = []
-
-    cat_where = _project_category_where(project_category)
-    if cat_where:
-        conditions.append(f"({cat_where})")
+    where, cat_where = _build_project_where(
+        status,
+        project_status,
+        tuple(project_types or ()),
+        jurisdiction,
+        project_partners,
+        subshed,
+        project_category,
+    )
 
-    if project_types and len(project_types) > 0:
-        safe_types = [str(t).strip().replace("'", "''") for t in project_types if t and str(t).strip()]
-        if safe_types:
-            in_clause = ",".join(f"'{t}'" for t in safe_types)
-            conditions.append(f"projecttype IN ({in_clause})")
-    if status and str(status).strip():
-        safe = str(status).strip().replace("'", "''")
-        conditions.append(f"UPPER(status) = UPPER('{safe}')")
-    if project_status and str(project_status).strip():
-        safe = str(project_status).strip().replace("'", "''")
-        conditions.append(f"UPPER(ProjectStatus) = UPPER('{safe}')")
-    if jurisdiction and str(jurisdiction).strip():
-        safe = str(jurisdiction).strip().replace("'", "''")
-        conditions.append(f"UPPER(jurisdiction) LIKE UPPER('%{safe}%')")
-    if project_partners and str(project_partners).strip():
-        safe = str(project_partners).strip().replace("'", "''")
-        conditions.append(f"UPPER(ProjectPartners) LIKE UPPER('%{safe}%')")
-    if subshed and str(subshed).strip():
-        safe = str(subshed).strip().replace("'", "''")
-        conditions.append(f"UPPER(Subshed) LIKE UPPER('%{safe}%')")
-
-    if not conditions and not allow_no_filters:
+    if where is None and not allow_no_filters:
         return {"found": False, "matches": [], "limit_exceeded": False, "message": "No filters provided."}
 
-    where = " AND ".join(conditions) if conditions else "1=1"
-    if allow_no_filters and not conditions:
+    if where is None:
+        where = "1=1"
         effective_limit = MAX_PROJECTS_SEMANTIC_SEARCH
-    elif project_category and project_category.lower() in (PROJECT_CATEGORY_PROJECTS, PROJECT_CATEGORY_STUDIES, PROJECT_CATEGORY_FLOOD_AUDITS):
+    elif cat_where:
         effective_limit = max(limit, MAX_PROJECTS_BY_CATEGORY)
     else:
         effective_limit = limit
     params = {
+        **_PROJECT_PARAMS,
         "where": where,
-        "outFields": "*",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
         "resultRecordCount": effective_limit + 1,
     }
 
     query_url = f"{layer['arcgis_url']}/query"
+    cache_key = (query_url, where, effective_limit)
+    cached = _projects_cache_get(cache_key)
+    if cached is not None:
+        logger.info("LC_QUERY_PROJECTS_CACHE_HIT", where=where, limit=effective_limit)
+        return cached
     logger.info("LC_QUERY_PROJECTS", where=where, limit=effective_limit)
 
+    client = get_client()
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.get(query_url, params=params)
-            resp.raise_for_status()
-            geojson = resp.json()
+        resp = await _arcgis_query(client, query_url, params, timeout=120.0)
+        resp.raise_for_status()
+        geojson = await _decode(resp)
     except Exception as e:
         logger.exception("LC_QUERY_HTTP_ERROR", error=str(e))
         return {"found": False, "matches": [], "limit_exceeded": False}
@@ -198,26 +719,18 @@ async def query_lake_county_projects(
         return {"found": False, "matches": [], "limit_exceeded": False}
 
     limit_exceeded = len(features) > effective_limit
-    features = features[:effective_limit]
-
-    # Group project IDs by geometry layer for batch fetch (3 HTTP calls total)
-    project_ids_by_layer: dict[str, list[int]] = {}
-    for feat in features:
-        attrs = feat.get("properties", {})
-        project_id = attrs.get("project_id")
-        geom_type = attrs.get("Geometry")
-        if project_id and geom_type:
-            layer_id = GEOMETRY_TYPE_TO_LAYER.get(geom_type)
-            if layer_id:
-                project_ids_by_layer.setdefault(layer_id, []).append(project_id)
+    if limit_exceeded:
+        features = features[:effective_limit]
+    if not features:
+        return {"found": True, "matches": [], "limit_exceeded": False}
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        geom_by_pid = await _batch_fetch_geometries(client, project_ids_by_layer)
+    # One batch query per geometry layer (3 HTTP calls total)
+    geom_by_pid = await _batch_fetch_geometries(client, _group_ids_by_layer(features))
 
     matches = []
     for feat in features:
         attrs = feat.get("properties", {})
-        rep_point_geojson = {"type": "FeatureCollection", "features": [feat]}
+        rep_point_geojson = _fc([feat])
         rep_geom = feat.get("geometry")
         project_id = attrs.get("project_id")
         geometry_geojson = geom_by_pid.get(project_id) if project_id else None
@@ -234,89 +747,113 @@ async def query_lake_county_projects(
             "geometry": geometry,
         })
 
-    return {"found": True, "matches": matches, "limit_exceeded": limit_exceeded}
+    result = {"found": True, "matches": matches, "limit_exceeded": limit_exceeded}
+    _projects_cache_put(cache_key, result)
+    return result
 
 
 async def fetch_municipality_boundary(jurisdiction_name: str) -> dict | None:
     """
     Fetch municipality boundary GeoJSON from Municipal Boundaries layer by name.
     Uses NAME field with LIKE match (case-insensitive). Returns outline geometry only.
+    Cached for 24 hours per matched NAME (inputs resolving to the same municipality share
+    one entry); stale entries are revalidated with a conditional GET.
     """
-    if not jurisdiction_name or not str(jurisdiction_name).strip():
+    name = str(jurisdiction_name).strip() if jurisdiction_name else ""
+    if not name:
         return None
-    safe = str(jurisdiction_name).strip().replace("'", "''")
-    where = f"UPPER(NAME) LIKE UPPER('%{safe}%')"
-    query_url = f"{LC_MUNICIPALITIES_URL}/query"
-    params = {
-        "where": where,
-        "outFields": "NAME",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
-    }
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(query_url, params=params)
+    alias = f"municipality:{name.lower()}"
+    cached = _boundary_cache_get(_municipality_aliases.get(alias, alias))
+    if cached is not None:
+        return cached
+    async with _cache_lock(alias):
+        # Another caller may have filled the cache while we waited
+        cache_key = _municipality_aliases.get(alias, alias)
+        cached = _boundary_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        where = _like_contains("NAME", name)
+        query_url = f"{LC_MUNICIPALITIES_URL}/query"
+        params = {
+            **_COMMON_PARAMS,
+            "where": where,
+            "outFields": "NAME",
+        }
+        try:
+            resp = await _arcgis_query(
+                get_client(), query_url, params, timeout=15.0,
+                headers=_boundary_revalidation_headers(cache_key),
+            )
+            not_modified = _boundary_not_modified(cache_key, resp)
+            if not_modified is not None:
+                return not_modified
             resp.raise_for_status()
-            data = resp.json()
-    except Exception as e:
-        logger.warning("LC_MUNI_BOUNDARY_FETCH_FAILED", jurisdiction=jurisdiction_name, error=str(e))
-        return None
-    if "error" in data or not data.get("features"):
-        return None
-    return data
+            data = await _decode(resp)
+        except Exception as e:
+            logger.warning("LC_MUNI_BOUNDARY_FETCH_FAILED", jurisdiction=jurisdiction_name, error=str(e))
+            return None
+        if "error" in data or not data.get("features"):
+            return None
+        cache_key = _municipality_cache_key(data) or alias
+        _boundary_cache_put(cache_key, data, resp)
+        _municipality_alias_put(alias, cache_key)
+        return data
 
 
 async def fetch_lake_county_boundary() -> dict | None:
-    """Fetch Lake County Boundary GeoJSON from ArcGIS MapServer."""
-    query_url = f"{LC_BOUNDARY_URL}/query"
-    params = {
-        "where": "1=1",
-        "outFields": "*",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
-    }
-    try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(query_url, params=params)
+    """
+    Fetch Lake County Boundary GeoJSON from the hosted ArcGIS FeatureServer layer.
+    Cached for 24 hours; stale entries are revalidated with a conditional GET.
+    """
+    cached = _boundary_cache_get("county")
+    if cached is not None:
+        return cached
+    async with _cache_lock("county"):
+        cached = _boundary_cache_get("county")
+        if cached is not None:
+            return cached
+        query_url = f"{LC_BOUNDARY_URL}/query"
+        params = {
+            **_COMMON_PARAMS,
+            "where": "1=1",
+        }
+        try:
+            resp = await _arcgis_query(
+                get_client(), query_url, params, timeout=15.0,
+                headers=_boundary_revalidation_headers("county"),
+            )
+            not_modified = _boundary_not_modified("county", resp)
+            if not_modified is not None:
+                return not_modified
             resp.raise_for_status()
-            data = resp.json()
-    except Exception as e:
-        logger.warning("LC_BOUNDARY_FETCH_FAILED", error=str(e))
-        return None
-    if "error" in data or not data.get("features"):
-        return None
-    return data
+            data = await _decode(resp)
+        except Exception as e:
+            logger.warning("LC_BOUNDARY_FETCH_FAILED", error=str(e))
+            return None
+        if "error" in data or not data.get("features"):
+            return None
+        _boundary_cache_put("county", data, resp)
+        return data
+
+
+def _group_ids_by_layer(features: list[dict]) -> dict[str, list[int]]:
+    """Bucket project_ids by the geometry layer their `Geometry` type lives in."""
+    project_ids_by_layer: defaultdict[str, list[int]] = defaultdict(list)
+    layer_for = GEOMETRY_TYPE_TO_LAYER.get
+    for feat in features:
+        attrs = feat.get("properties", {})
+        project_id = attrs.get("project_id")
+        if not project_id:
+            continue
+        layer_id = layer_for(attrs.get("Geometry"))
+        if layer_id:
+            project_ids_by_layer[layer_id].append(project_id)
+    return project_ids_by_layer
 
 
-async def _fetch_project_geometry(client: httpx.AsyncClient, project_id: int, geom_type: str) -> dict | None:
-    """Fetch geometry from Areas/Lines/Points layer by project_id."""
-    layer_id = GEOMETRY_TYPE_TO_LAYER.get(geom_type) if geom_type else None
-    if not layer_id:
-        return None
-    layer = LAKE_COUNTY_LAYERS_BY_ID.get(layer_id)
-    if not layer:
-        return None
-    query_url = f"{layer['arcgis_url']}/query"
-    params = {
-        "where": f"project_id = {project_id}",
-        "outFields": "*",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
-    }
-    try:
-        resp = await client.get(query_url, params=params)
-        resp.raise_for_status()
-        geojson = resp.json()
-    except Exception as e:
-        logger.warning("LC_FETCH_GEOM_ERROR", project_id=project_id, geom_type=geom_type, error=str(e))
-        return None
-    features = geojson.get("features", [])
-    if "error" in geojson or not features:
-        return None
-    return {"type": "FeatureCollection", "features": features}
+def _chunked(ids: list[int], size: int = GEOMETRY_BATCH_SIZE) -> list[list[int]]:
+    """Split ids into consecutive lists of at most `size` items."""
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
 
 
 async def _batch_fetch_geometries(
@@ -325,9 +862,11 @@ async def _batch_fetch_geometries(
 ) -> dict[int, dict]:
     """
     Fetch geometries for many projects in batch: one query per geometry layer
-    using `project_id IN (...)` instead of one HTTP call per project.
+    (per GEOMETRY_BATCH_SIZE ids) using `project_id IN (...)` instead of one HTTP call per project.
     Returns {project_id: FeatureCollection GeoJSON}.
     """
+    if not project_ids_by_layer:
+        return {}
     result: dict[int, dict] = {}
 
     async def _fetch_layer(layer_id: str, pids: list[int]) -> None:
@@ -336,37 +875,33 @@ async def _batch_fetch_geometries(
             return
         query_url = f"{layer['arcgis_url']}/query"
         id_list = ",".join(str(p) for p in pids)
-        # POST avoids URL length limits that cause 404 on large IN clauses
         form_data = {
+            **_GEOMETRY_BATCH_PARAMS,
             "where": f"project_id IN ({id_list})",
             "outFields": "project_id",
-            "returnGeometry": "true",
-            "outSR": "4326",
-            "f": "geojson",
-            "resultRecordCount": "2000",
         }
         try:
-            resp = await client.post(query_url, data=form_data, timeout=120.0)
+            resp = await _arcgis_query(client, query_url, form_data, timeout=120.0)
             resp.raise_for_status()
-            geojson = resp.json()
+            data = await _decode(resp)
         except Exception as e:
             logger.warning("LC_BATCH_GEOM_ERROR", layer_id=layer_id, count=len(pids), error=str(e))
             return
-        if "error" in geojson:
-            logger.warning("LC_BATCH_GEOM_ARCGIS_ERROR", layer_id=layer_id, error=geojson.get("error"))
+        if "error" in data:
+            logger.warning("LC_BATCH_GEOM_ARCGIS_ERROR", layer_id=layer_id, error=data.get("error"))
             return
-        for feat in geojson.get("features", []):
-            pid = feat.get("properties", {}).get("project_id")
+        for feat in data.get("features", []):
+            pid = feat.get("attributes", {}).get("project_id")
             if pid is None:
                 continue
             if pid not in result:
-                result[pid] = {"type": "FeatureCollection", "features": []}
-            result[pid]["features"].append(feat)
+                result[pid] = _fc([])
+            result[pid]["features"].append(_esri_feature(feat))
 
     await asyncio.gather(*[
-        _fetch_layer(layer_id, pids)
+        _fetch_layer(layer_id, chunk)
         for layer_id, pids in project_ids_by_layer.items()
-        if pids
+        for chunk in _chunked(pids)
     ])
     return result
 
@@ -378,7 +913,8 @@ async def search_lake_county_project(name: str) -> dict[str, Any]:
     """
     logger.info("LC_SEARCH_START", name=name, layer_id=LAKE_COUNTY_SEARCH_LAYER_ID)
 
-    if not name or not name.strip():
+    term = name.strip() if name else ""
+    if not term:
         logger.warning("LC_SEARCH_EMPTY_NAME")
         return {"found": False, "matches": []}
 
@@ -388,15 +924,11 @@ async def search_lake_county_project(name: str) -> dict[str, Any]:
         return {"found": False, "matches": []}
 
     query_url = f"{layer['arcgis_url']}/query"
-    safe_name = name.strip().replace("'", "''")
-    where = f"UPPER(Name) LIKE UPPER('%{safe_name}%')"
+    where = _like_contains("Name", term)
 
     params = {
+        **_COMMON_PARAMS,
         "where": where,
-        "outFields": "*",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
         "resultRecordCount": MAX_MATCHES,
     }
     # Lake County SMC service is public - token causes 498 Invalid token if expired
@@ -412,17 +944,17 @@ async def search_lake_county_project(name: str) -> dict[str, Any]:
         has_token=has_token,
     )
 
+    client = get_client()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(query_url, params=params)
-            logger.info(
-                "LC_SEARCH_HTTP_RESPONSE",
-                status=resp.status_code,
-                url=str(resp.url),
-            )
+        resp = await _arcgis_query(client, query_url, params, timeout=30.0)
+        logger.info(
+            "LC_SEARCH_HTTP_RESPONSE",
+            status=resp.status_code,
+            url=str(resp.url),
+        )
 
-            resp.raise_for_status()
-            geojson = resp.json()
+        resp.raise_for_status()
+        geojson = await _decode(resp)
     except Exception as e:
         logger.exception("LC_SEARCH_HTTP_ERROR", error=str(e), error_type=type(e).__name__)
         return {"found": False, "matches": []}
@@ -438,25 +970,22 @@ async def search_lake_county_project(name: str) -> dict[str, Any]:
         logger.warning("LC_SEARCH_NO_FEATURES", response_keys=list(geojson.keys()))
         return {"found": False, "matches": []}
 
+    features = features[:MAX_MATCHES]
+    geom_by_pid = await _batch_fetch_geometries(client, _group_ids_by_layer(features))
+
     matches = []
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        async def _fetch_search_match(feat):
-            attrs = feat.get("properties", {})
-            rep_geom = feat.get("geometry")
-            rep_point_geojson = {"type": "FeatureCollection", "features": [feat]}
-            project_id = attrs.get("project_id")
-            geom_type = attrs.get("Geometry")
-            geometry_geojson = None
-            if project_id and geom_type:
-                geometry_geojson = await _fetch_project_geometry(client, project_id, geom_type)
-            return {
-                "rep_point_geojson": rep_point_geojson,
-                "geometry_geojson": geometry_geojson,
-                "geojson": geometry_geojson or rep_point_geojson,
-                "attributes": attrs,
-                "geometry": geometry_geojson["features"][0]["geometry"] if geometry_geojson and geometry_geojson.get("features") else rep_geom,
-            }
-        matches = list(await asyncio.gather(*[_fetch_search_match(f) for f in features[:MAX_MATCHES]]))
+    for feat in features:
+        attrs = feat.get("properties", {})
+        project_id = attrs.get("project_id")
+        geometry_geojson = geom_by_pid.get(project_id) if project_id else None
+        rep_point_geojson = _fc([feat])
+        matches.append({
+            "rep_point_geojson": rep_point_geojson,
+            "geometry_geojson": geometry_geojson,
+            "geojson": geometry_geojson or rep_point_geojson,
+            "attributes": attrs,
+            "geometry": geometry_geojson["features"][0]["geometry"] if geometry_geojson and geometry_geojson.get("features") else feat.get("geometry"),
+        })
 
     logger.info("LC_SEARCH_SUCCESS", matches_count=len(matches), first_name=matches[0]["attributes"].get("Name") if matches else None)
     return {"found": True, "matches": matches}
@@ -465,27 +994,44 @@ async def search_lake_county_project(name: str) -> dict[str, Any]:
 MAX_PREAPPS = 200
 
 
-async def _fetch_preapp_geometries(client: httpx.AsyncClient, preapp_id: int) -> dict | None:
-    """Fetch polygon/line geometries from PreApp layer 99 by preapp_id."""
+async def _batch_fetch_preapp_geometries(
+    client: httpx.AsyncClient,
+    preapp_ids: list[int],
+) -> dict[int, dict]:
+    """
+    Fetch polygon/line geometries from PreApp layer 99 in batch: one
+    `preapp_id IN (...)` query per GEOMETRY_BATCH_SIZE ids.
+    Returns {preapp_id: FeatureCollection GeoJSON}.
+    """
+    if not preapp_ids:
+        return {}
+    result: dict[int, dict] = {}
     query_url = f"{PREAPP_GEOMETRY_URL}/query"
-    params = {
-        "where": f"preapp_id = {preapp_id}",
-        "outFields": "*",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
-    }
-    try:
-        resp = await client.get(query_url, params=params)
-        resp.raise_for_status()
-        geojson = resp.json()
-    except Exception as e:
-        logger.warning("LC_PREAPP_GEOM_FETCH_FAILED", preapp_id=preapp_id, error=str(e))
-        return None
-    features = geojson.get("features", [])
-    if "error" in geojson or not features:
-        return None
-    return {"type": "FeatureCollection", "features": features}
+
+    async def _fetch_chunk(ids: list[int]) -> None:
+        id_list = ",".join(str(p) for p in ids)
+        form_data = {
+            **_GEOMETRY_BATCH_PARAMS,
+            "where": f"preapp_id IN ({id_list})",
+            "outFields": "preapp_id",
+        }
+        try:
+            resp = await _arcgis_query(client, query_url, form_data, timeout=120.0)
+            resp.raise_for_status()
+            data = await _decode(resp)
+        except Exception as e:
+            logger.warning("LC_BATCH_PREAPP_GEOM_ERROR", count=len(ids), error=str(e))
+            return
+        for feat in data.get("features", []):
+            pid = feat.get("attributes", {}).get("preapp_id")
+            if pid is None:
+                continue
+            if pid not in result:
+                result[pid] = _fc([])
+            result[pid]["features"].append(_esri_feature(feat))
+
+    await asyncio.gather(*[_fetch_chunk(chunk) for chunk in _chunked(preapp_ids)])
+    return result
 
 
 async def query_lake_county_preapps(
@@ -502,31 +1048,23 @@ async def query_lake_county_preapps(
     Returns matches with geometry from layer 98 (points) or 99 (polygons/lines).
     """
     conditions = ["status <> 'Archived'"]
-    if jurisdiction and str(jurisdiction).strip():
-        safe = str(jurisdiction).strip().replace("'", "''")
-        conditions.append(f"UPPER(jurisdiction) LIKE UPPER('%{safe}%')")
-    if subshed and str(subshed).strip():
-        safe = str(subshed).strip().replace("'", "''")
-        conditions.append(f"UPPER(Subshed) LIKE UPPER('%{safe}%')")
+    conditions += _like_clauses({"jurisdiction": jurisdiction, "Subshed": subshed})
 
     where = " AND ".join(conditions)
     params = {
+        **_COMMON_PARAMS,
         "where": where,
-        "outFields": "*",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
         "resultRecordCount": limit + 1,
     }
 
     query_url = f"{PREAPP_POINT_URL}/query"
     logger.info("LC_QUERY_PREAPPS", where=where, limit=limit)
 
+    client = get_client()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(query_url, params=params)
-            resp.raise_for_status()
-            geojson = resp.json()
+        resp = await _arcgis_query(client, query_url, params, timeout=30.0)
+        resp.raise_for_status()
+        geojson = await _decode(resp)
     except Exception as e:
         logger.exception("LC_PREAPPS_QUERY_HTTP_ERROR", error=str(e))
         return {"found": False, "matches": [], "limit_exceeded": False}
@@ -536,39 +1074,18 @@ async def query_lake_county_preapps(
         return {"found": False, "matches": [], "limit_exceeded": False}
 
     limit_exceeded = len(features) > limit
-    features = features[:limit]
+    if limit_exceeded:
+        features = features[:limit]
+    if not features:
+        return {"found": True, "matches": [], "limit_exceeded": False}
 
-    # Batch fetch preapp geometries from layer 99 (single query)
+    # Batch fetch preapp geometries from layer 99 (one query per GEOMETRY_BATCH_SIZE ids)
     preapp_ids = [
         feat.get("properties", {}).get("preapp_id")
         for feat in features
         if feat.get("properties", {}).get("preapp_id") is not None
     ]
-    geom_by_preapp: dict[int, dict] = {}
-    if preapp_ids:
-        id_list = ",".join(str(p) for p in preapp_ids)
-        geom_query_url = f"{PREAPP_GEOMETRY_URL}/query"
-        form_data = {
-            "where": f"preapp_id IN ({id_list})",
-            "outFields": "preapp_id",
-            "returnGeometry": "true",
-            "outSR": "4326",
-            "f": "geojson",
-            "resultRecordCount": "2000",
-        }
-        try:
-            async with httpx.AsyncClient(timeout=120.0) as geom_client:
-                geom_resp = await geom_client.post(geom_query_url, data=form_data)
-                geom_resp.raise_for_status()
-                geom_json = geom_resp.json()
-            for gfeat in geom_json.get("features", []):
-                pid = gfeat.get("properties", {}).get("preapp_id")
-                if pid is not None:
-                    if pid not in geom_by_preapp:
-                        geom_by_preapp[pid] = {"type": "FeatureCollection", "features": []}
-                    geom_by_preapp[pid]["features"].append(gfeat)
-        except Exception as e:
-            logger.warning("LC_BATCH_PREAPP_GEOM_ERROR", count=len(preapp_ids), error=str(e))
+    geom_by_preapp = await _batch_fetch_preapp_geometries(client, preapp_ids)
 
     matches = []
     for feat in features:
@@ -577,7 +1094,7 @@ async def query_lake_county_preapps(
         point_geom = feat.get("geometry")
         rep_point_geojson = None
         if point_geom and point_geom.get("type") == "Point":
-            rep_point_geojson = {"type": "FeatureCollection", "features": [feat]}
+            rep_point_geojson = _fc([feat])
         geometry_geojson = geom_by_preapp.get(preapp_id) if preapp_id else None
         geometry = None
         if geometry_geojson and geometry_geojson.get("features"):
@@ -614,37 +1131,28 @@ async def query_lake_county_concerns(
     Point geometry only.
     """
     conditions = ["status_CIRS <> 'Archived'"]
-    if jurisdiction and str(jurisdiction).strip():
-        safe = str(jurisdiction).strip().replace("'", "''")
-        conditions.append(f"UPPER(jurisdiction) LIKE UPPER('%{safe}%')")
-    if category_report and str(category_report).strip():
-        safe = str(category_report).strip().replace("'", "''")
-        conditions.append(f"UPPER(category_report) LIKE UPPER('%{safe}%')")
-    if problem and str(problem).strip():
-        safe = str(problem).strip().replace("'", "''")
-        conditions.append(f"UPPER(problem) LIKE UPPER('%{safe}%')")
-    if frequency_problem and str(frequency_problem).strip():
-        safe = str(frequency_problem).strip().replace("'", "''")
-        conditions.append(f"UPPER(frequency_problem) LIKE UPPER('%{safe}%')")
+    conditions += _like_clauses({
+        "jurisdiction": jurisdiction,
+        "category_report": category_report,
+        "problem": problem,
+        "frequency_problem": frequency_problem,
+    })
 
     where = " AND ".join(conditions)
     params = {
+        **_COMMON_PARAMS,
         "where": where,
-        "outFields": "*",
-        "returnGeometry": "true",
-        "outSR": 4326,
-        "f": "geojson",
         "resultRecordCount": limit + 1,
     }
 
     query_url = f"{CIRS_POINT_URL}/query"
     logger.info("LC_QUERY_CONCERNS", where=where, limit=limit)
 
+    client = get_client()
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(query_url, params=params)
-            resp.raise_for_status()
-            geojson = resp.json()
+        resp = await _arcgis_query(client, query_url, params, timeout=30.0)
+        resp.raise_for_status()
+        geojson = await _decode(resp)
     except Exception as e:
         logger.exception("LC_CONCERNS_QUERY_HTTP_ERROR", error=str(e))
         return {"found": False, "matches": [], "limit_exceeded": False}
@@ -654,13 +1162,16 @@ async def query_lake_county_concerns(
         return {"found": False, "matches": [], "limit_exceeded": False}
 
     limit_exceeded = len(features) > limit
-    features = features[:limit]
+    if limit_exceeded:
+        features = features[:limit]
+    if not features:
+        return {"found": True, "matches": [], "limit_exceeded": False}
 
     matches = []
     for feat in features:
         attrs = feat.get("properties", {})
         geom = feat.get("geometry")
-        rep_point_geojson = {"type": "FeatureCollection", "features": [feat]}
+        rep_point_geojson = _fc([feat])
         matches.append({
             "rep_point_geojson": rep_point_geojson,
             "geometry_geojson": None,
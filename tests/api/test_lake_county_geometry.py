@@ -0,0 +1,81 @@
+import pytest
+
+from src.api.lake_county_service import _esri_to_geojson_geom
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_db():
+    """Override the global test_db fixture to avoid database connections."""
+    pass
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_db_session():
+    """Override the global test_db_session fixture to avoid database connections."""
+    pass
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_db_pool():
+    """Override the global test_db_pool fixture to avoid database pool operations."""
+    pass
+
+
+# Esri outer rings are clockwise, holes counter-clockwise
+OUTER = [[0, 0], [0, 10], [10, 10], [10, 0], [0, 0]]
+HOLE = [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]]
+OTHER_OUTER = [[20, 20], [20, 30], [30, 30], [30, 20], [20, 20]]
+
+
+def test_point():
+    assert _esri_to_geojson_geom({"x": -87.8, "y": 42.3}) == {
+        "type": "Point",
+        "coordinates": [-87.8, 42.3],
+    }
+
+
+def test_single_path_is_linestring():
+    path = [[0, 0], [1, 1], [2, 0]]
+    assert _esri_to_geojson_geom({"paths": [path]}) == {
+        "type": "LineString",
+        "coordinates": path,
+    }
+
+
+def test_multiple_paths_are_multilinestring():
+    paths = [[[0, 0], [1, 1]], [[5, 5], [6, 6]]]
+    assert _esri_to_geojson_geom({"paths": paths}) == {
+        "type": "MultiLineString",
+        "coordinates": paths,
+    }
+
+
+def test_polygon_with_hole():
+    geom = _esri_to_geojson_geom({"rings": [OUTER, HOLE]})
+    assert geom == {
+        "type": "Polygon",
+        # Exterior counter-clockwise, hole clockwise (RFC 7946)
+        "coordinates": [OUTER[::-1], HOLE[::-1]],
+    }
+
+
+def test_multipolygon_assigns_hole_to_containing_ring():
+    geom = _esri_to_geojson_geom({"rings": [OTHER_OUTER, OUTER, HOLE]})
+    assert geom == {
+        "type": "MultiPolygon",
+        "coordinates": [[OTHER_OUTER[::-1]], [OUTER[::-1], HOLE[::-1]]],
+    }
+
+
+def test_counter_clockwise_only_rings_keep_their_winding():
+    geom = _esri_to_geojson_geom({"rings": [HOLE]})
+    assert geom == {"type": "Polygon", "coordinates": [HOLE]}
+
+
+def test_empty_input():
+    assert _esri_to_geojson_geom(None) is None
+    assert _esri_to_geojson_geom({}) is None
+    assert _esri_to_geojson_geom({"rings": []}) is None
+    assert _esri_to_geojson_geom({"paths": []}) is None
+    assert _esri_to_geojson_geom({"points": []}) is None
+    assert _esri_to_geojson_geom({"x": None, "y": None}) is None
@@ -0,0 +1,88 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.api import lake_county_service as lcs
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_db():
+    """Override the global test_db fixture to avoid database connections."""
+    pass
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_db_session():
+    """Override the global test_db_session fixture to avoid database connections."""
+    pass
+
+
+@pytest.fixture(scope="function", autouse=True)
+def test_db_pool():
+    """Override the global test_db_pool fixture to avoid database pool operations."""
+    pass
+
+
+PROJECTS_RESPONSE = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [-87.9, 42.3]},
+            "properties": {"project_id": 1, "Name": "Creek Restoration", "Geometry": None},
+        }
+    ],
+}
+
+
+@pytest.fixture
+def arcgis_query():
+    """Fresh project cache and a mocked ArcGIS query returning PROJECTS_RESPONSE."""
+    with (
+        patch.object(lcs, "_projects_cache", {}),
+        patch.object(lcs, "get_client", return_value=None),
+        patch.object(lcs, "_decode", new_callable=AsyncMock, return_value=PROJECTS_RESPONSE),
+        patch.object(lcs, "_arcgis_query", new_callable=AsyncMock) as query,
+    ):
+        query.return_value = MagicMock()
+        yield query
+
+
+async def test_cached_projects_are_not_changed_by_callers(arcgis_query):
+    first = await lcs.query_lake_county_projects(jurisdiction="Waukegan")
+    first["matches"][0]["attributes"]["Name"] = "Changed"
+    first["matches"].clear()
+
+    second = await lcs.query_lake_county_projects(jurisdiction="Waukegan")
+
+    assert arcgis_query.await_count == 1
+    assert len(second["matches"]) == 1
+    assert second["matches"][0]["attributes"]["Name"] == "Creek Restoration"
+
+
+async def test_different_filters_use_different_cache_keys(arcgis_query):
+    await lcs.query_lake_county_projects(jurisdiction="Waukegan")
+    await lcs.query_lake_county_projects(jurisdiction="Libertyville")
+    await lcs.query_lake_county_projects(jurisdiction="Waukegan", status="Complete")
+
+    assert arcgis_query.await_count == 3
+    assert len(lcs._projects_cache) == 3
+
+
+def test_project_where_escapes_filter_values():
+    where, cat_where = lcs._build_project_where(
+        " O'Neil ",
+        None,
+        ("Capital'",),
+        "50%_O'Brien\\",
+        None,
+        None,
+        None,
+    )
+
+    assert cat_where is None
+    assert where == (
+        "projecttype IN ('Capital''') AND "
+        "UPPER(status) = UPPER('O''Neil') AND "
+        "UPPER(jurisdiction) LIKE UPPER('%50\\%\\_O''Brien\\\\%') ESCAPE '\\'"
+    )